@@ -0,0 +1,84 @@
+# 2つの負荷試験結果（bench/results/*.json）を比べ、悪化したルートがあれば終了コード1
+#   python -m bench.compare bench/results/BEFORE.json bench/results/AFTER.json
+#   python -m bench.compare BEFORE.json AFTER.json --threshold 0.05
+import argparse
+import json
+import sys
+
+# (指標, 大きいほど悪いか)
+METRICS = [
+    ("p50_ms", True),
+    ("p95_ms", True),
+    ("p99_ms", True),
+    ("throughput", False),
+    ("queries_per_request", True),
+]
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def change(before, after):
+    if before in (None, 0) or after is None:
+        return None
+    return (after - before) / before
+
+
+# 悪化の判定。クエリ数は1件でも増えたら悪化とする
+def is_regression(metric, higher_is_worse, before, after, threshold):
+    if before is None or after is None:
+        return False
+    if metric == "queries_per_request":
+        return after - before >= 1
+    ratio = change(before, after)
+    if ratio is None:
+        return False
+    return ratio > threshold if higher_is_worse else ratio < -threshold
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args()
+
+    before, after = load(args.before), load(args.after)
+    print(
+        f"before: {before.get('revision')} {before.get('date')} {before.get('label')}"
+    )
+    print(f"after:  {after.get('revision')} {after.get('date')} {after.get('label')}")
+    for key in ("dataset", "concurrency", "requests_per_route"):
+        if before.get(key) != after.get(key):
+            print(f"warning: {key} differs ({before.get(key)} -> {after.get(key)})")
+
+    regressions = []
+    for route, b in before["routes"].items():
+        a = after["routes"].get(route)
+        if a is None:
+            continue
+        cells = []
+        for metric, higher_is_worse in METRICS:
+            ratio = change(b[metric], a[metric])
+            mark = ""
+            if is_regression(
+                metric, higher_is_worse, b[metric], a[metric], args.threshold
+            ):
+                regressions.append((route, metric))
+                mark = " !"
+            delta = "" if ratio is None else f" ({ratio:+.0%})"
+            cells.append(f"{metric} {b[metric]} -> {a[metric]}{delta}{mark}")
+        print(f"{route}\n    " + "\n    ".join(cells))
+
+    if regressions:
+        print(f"{len(regressions)} regressions (threshold {args.threshold:.0%}):")
+        for route, metric in regressions:
+            print(f"    {route} {metric}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# 負荷試験用の合成データの規模とIDの決め方
+# seed（投入）と load（負荷）の両方で同じ --scale を指定すれば、同じIDを参照できる
+import random
+
+# --scale 1 のときの件数
+BASE_SIZES = {
+    "services": 2,
+    "users": 200,
+    "groups_per_service": 10,
+    "contents_per_service": 50,
+    "videos_per_service": 100,
+    "assignments_per_group": 20,
+    "events_per_service": 60,
+}
+
+STATUSES_PER_SERVICE = 3
+
+# 全ユーザー共通のパスワード（/login で使う）
+PASSWORD = "bench-password"
+
+
+class Dataset:
+    def __init__(self, scale=1.0):
+        self.scale = scale
+        for name, size in BASE_SIZES.items():
+            # サービス数は増やしすぎず、1サービスあたりの件数を増やす
+            factor = 1 if name == "services" else scale
+            setattr(self, name, max(1, int(size * factor)))
+        self.groups = self.services * self.groups_per_service
+
+    def sizes(self):
+        return {name: getattr(self, name) for name in BASE_SIZES}
+
+    # ID（UUIDと同じく36文字以内の文字列）
+    @staticmethod
+    def service_id(i):
+        return f"bench-service-{i:04d}"
+
+    @staticmethod
+    def status_id(service, i):
+        return f"bench-status-{service:04d}-{i}"
+
+    @staticmethod
+    def user_id(i):
+        return f"bench-user-{i:07d}"
+
+    @staticmethod
+    def email(i):
+        return f"bench-user-{i}@example.com"
+
+    @staticmethod
+    def group_id(i):
+        return f"bench-group-{i:05d}"
+
+    @staticmethod
+    def content_id(service, i):
+        return f"bench-content-{service:04d}-{i:05d}"
+
+    @staticmethod
+    def video_id(service, i):
+        return f"bench-video-{service:04d}-{i:05d}"
+
+    @staticmethod
+    def assignment_id(group, i):
+        return f"bench-assignment-{group:05d}-{i:04d}"
+
+    @staticmethod
+    def event_id(service, i):
+        return f"bench-event-{service:04d}-{i:05d}"
+
+    # ユーザーはサービスに順番に割り振り、サービス内の班に順番に割り振る
+    def service_of_user(self, user):
+        return user % self.services
+
+    def group_of_user(self, user):
+        service = self.service_of_user(user)
+        index = (user // self.services) % self.groups_per_service
+        return service * self.groups_per_service + index
+
+    def service_of_group(self, group):
+        return group // self.groups_per_service
+
+    # 負荷試験で使う、実在するユーザー（とその所属）をランダムに選ぶ
+    def random_user(self, rng: random.Random):
+        user = rng.randrange(self.users)
+        return {
+            "index": user,
+            "user_id": self.user_id(user),
+            "email": self.email(user),
+            "service": self.service_of_user(user),
+            "service_id": self.service_id(self.service_of_user(user)),
+            "group_id": self.group_id(self.group_of_user(user)),
+            "status_id": self.status_id(
+                self.service_of_user(user), user % STATUSES_PER_SERVICE
+            ),
+        }
@@ -0,0 +1,306 @@
+# 起動中のサーバーに全ルートを並行して投げ、レイテンシ・スループット・1リクエストあたりのクエリ数を計る
+#   python -m bench.seed --scale 1
+#   uvicorn backend:app --port 8000
+#   python -m bench.load --scale 1 --concurrency 32 --requests 500
+# 結果は bench/results/ にJSONで保存する（比較は python -m bench.compare）
+# クエリ数は SHOW GLOBAL STATUS の Questions の差分なので、ベンチ中は他からDBを使わないこと
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import httpx
+import mysql.connector
+
+from backend import admin_token, db_config
+from bench.dataset import PASSWORD, Dataset
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+# ルートごとのリクエストの作り方 -> (メソッド, パス, JSON本文)
+def login(ds, user, n):
+    return "POST", "/login", {"email": user["email"], "password": PASSWORD}
+
+
+def register(ds, user, n):
+    body = {
+        "last_name": "負荷",
+        "first_name": "試験",
+        "last_name_kana": "フカ",
+        "first_name_kana": "シケン",
+        "email": f"bench-register-{n}-{time.time_ns()}@example.com",
+        "phone_number": "09000000000",
+        "password": PASSWORD,
+    }
+    return "POST", "/register", body
+
+
+# 今日から30日間のイベント（カレンダーの1か月分の表示）
+def geteventdate_month(ds, user, n):
+    today = date.today()
+    path = f"/geteventdate/{user['service_id']}?from={today}&to={today + timedelta(days=30)}"
+    return "GET", path, None
+
+
+# 5分前の透かしからの差分（ポーリング中のクライアント）
+def changes(ds, user, n):
+    since = (datetime.now(timezone.utc) - timedelta(minutes=5)).strftime(
+        "%Y%m%dT%H%M%SZ"
+    )
+    path = f"/changes/{user['service_id']}?group_id={user['group_id']}&since={since}"
+    return "GET", path, None
+
+
+ROUTES = {
+    "login": login,
+    "register": register,
+    "getstatus": lambda ds, user, n: ("GET", f"/getstatus/{user['status_id']}", None),
+    "getuserstatus": lambda ds, user, n: (
+        "GET",
+        f"/getuserstatus/{user['user_id']}",
+        None,
+    ),
+    "getcontents": lambda ds, user, n: (
+        "GET",
+        f"/getcontents/{user['service_id']}",
+        None,
+    ),
+    "getcontents_page": lambda ds, user, n: (
+        "GET",
+        f"/getcontents/{user['service_id']}?limit=20",
+        None,
+    ),
+    "mygroup": lambda ds, user, n: (
+        "POST",
+        "/mygroup",
+        {"user_id": user["user_id"], "service_id": user["service_id"]},
+    ),
+    "getlecturedata": lambda ds, user, n: (
+        "GET",
+        f"/getlecturedata/{user['service_id']}",
+        None,
+    ),
+    "getlecturedata_stream": lambda ds, user, n: (
+        "GET",
+        f"/getlecturedata/{user['service_id']}?stream=true",
+        None,
+    ),
+    "getmylecture": lambda ds, user, n: (
+        "GET",
+        f"/getmylecture/{user['group_id']}",
+        None,
+    ),
+    "getmyassignment": lambda ds, user, n: (
+        "GET",
+        f"/getmyassignment/{user['group_id']}",
+        None,
+    ),
+    "getmyassignment_deadline": lambda ds, user, n: (
+        "GET",
+        f"/getmyassignment-deadline/{user['group_id']}",
+        None,
+    ),
+    "getmyassignment_deadline_week": lambda ds, user, n: (
+        "GET",
+        f"/getmyassignment-deadline/{user['group_id']}?within_days=7",
+        None,
+    ),
+    "geteventdate": lambda ds, user, n: (
+        "GET",
+        f"/geteventdate/{user['service_id']}",
+        None,
+    ),
+    "geteventdate_month": geteventdate_month,
+    "calendar": lambda ds, user, n: (
+        "GET",
+        f"/calendar/{user['service_id']}.ics",
+        None,
+    ),
+    "changes": changes,
+    "dashboard": lambda ds, user, n: (
+        "POST",
+        "/dashboard",
+        {"user_id": user["user_id"], "service_id": user["service_id"]},
+    ),
+}
+
+
+# サーバーが受け付けた文の累計（この SHOW 自体も1件数えられる）
+def questions(conn):
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SHOW GLOBAL STATUS LIKE 'Questions'")
+        return int(cursor.fetchone()[1])
+    finally:
+        cursor.close()
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies, errors, elapsed, query_count):
+    latencies = sorted(latencies)
+    count = len(latencies)
+
+    def ms(value):
+        return None if value is None else round(value * 1000, 3)
+
+    return {
+        "requests": count,
+        "errors": errors,
+        "throughput": round(count / elapsed, 2) if elapsed else None,
+        "mean_ms": ms(sum(latencies) / count) if count else None,
+        "p50_ms": ms(percentile(latencies, 50)),
+        "p95_ms": ms(percentile(latencies, 95)),
+        "p99_ms": ms(percentile(latencies, 99)),
+        "max_ms": ms(latencies[-1]) if latencies else None,
+        "queries_per_request": (
+            round(query_count / count, 3) if count and query_count is not None else None
+        ),
+    }
+
+
+# 1ルートを requests 件、concurrency 並列で実行する
+async def run_route(client, ds, name, requests, concurrency, seed):
+    make_request = ROUTES[name]
+    rng = random.Random(seed)
+    jobs = [make_request(ds, ds.random_user(rng), n) for n in range(requests)]
+    latencies = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        while jobs:
+            method, path, body = jobs.pop()
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                await response.aread()
+                failed = response.status_code >= 400
+            except httpx.HTTPError as err:
+                print(f"  {name}: {err!r}")
+                failed = True
+            latencies.append(time.perf_counter() - start)
+            errors += failed
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def git_revision():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("-dirty" if dirty else "")
+
+
+async def run(args):
+    ds = Dataset(args.scale)
+    names = args.routes or list(ROUTES)
+    conn = None if args.no_db_stats else mysql.connector.connect(**db_config)
+    results = {}
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=args.timeout
+    ) as client:
+        for index, name in enumerate(names):
+            # ウォームアップ（キャッシュ・接続プールを温める。計測には含めない）
+            if args.warmup:
+                await run_route(
+                    client, ds, name, args.warmup, args.concurrency, args.seed - index
+                )
+            before = questions(conn) if conn else None
+            latencies, errors, elapsed = await run_route(
+                client, ds, name, args.requests, args.concurrency, args.seed + index
+            )
+            # 自分の SHOW GLOBAL STATUS の1件を引く
+            query_count = questions(conn) - before - 1 if conn else None
+            results[name] = summarize(latencies, errors, elapsed, query_count)
+            r = results[name]
+            print(
+                f"{name:<26} {r['throughput']:>9.1f} req/s  p50 {r['p50_ms']:>8.2f}  "
+                f"p95 {r['p95_ms']:>8.2f}  p99 {r['p99_ms']:>8.2f} ms  "
+                f"q/req {r['queries_per_request']}  errors {errors}"
+            )
+        # /stats は管理用API（.env の admin_token が無ければ取らない）
+        server_stats = None
+        if admin_token:
+            response = await client.get(
+                "/stats", headers={"Authorization": f"Bearer {admin_token}"}
+            )
+            if response.status_code == 200:
+                server_stats = response.json()
+    if conn:
+        conn.close()
+    return results, server_stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--routes", nargs="*", choices=sorted(ROUTES))
+    parser.add_argument("--no-db-stats", action="store_true")
+    parser.add_argument("--label", default="")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    started = datetime.now(timezone.utc)
+    results, server_stats = asyncio.run(run(args))
+
+    revision = git_revision()
+    report = {
+        "label": args.label,
+        "revision": revision,
+        "date": started.isoformat(timespec="seconds"),
+        "base_url": args.base_url,
+        "dataset": {"scale": args.scale, **Dataset(args.scale).sizes()},
+        "concurrency": args.concurrency,
+        "requests_per_route": args.requests,
+        "warmup_per_route": args.warmup,
+        "routes": results,
+        "server_stats": server_stats,
+    }
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        name = started.strftime("%Y%m%dT%H%M%S") + f"_{revision or 'unknown'}"
+        if args.label:
+            name += f"_{args.label}"
+        output = os.path.join(RESULTS_DIR, name + ".json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"saved {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
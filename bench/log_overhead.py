@@ -0,0 +1,87 @@
+# ログ出力がリクエスト処理のスレッドを止める時間のマイクロベンチマーク（1件あたり）
+# 遅い出力先（1回の書き込みに --sink-delay-us かかる）に対して、
+# 従来の print() と、キュー経由のロガー（間引きあり・なし）を比べる
+#   python -m bench.log_overhead --messages 20000
+import argparse
+import logging
+import sys
+import time
+from logging.handlers import QueueListener
+
+import backend
+
+
+class SlowSink:
+    def __init__(self, delay):
+        self.delay = delay
+
+    def write(self, text):
+        if text.strip():
+            time.sleep(self.delay)
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def per_call_us(func, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        func()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--sink-delay-us", type=float, default=50)
+    args = parser.parse_args()
+
+    sink = SlowSink(args.sink_delay_us / 1e6)
+
+    # 従来：リクエスト処理のスレッドで直接書き込む
+    stdout = sys.stdout
+    sys.stdout = sink
+    try:
+        legacy = per_call_us(
+            lambda: print("No content found for the provided service ID."),
+            args.messages,
+        )
+    finally:
+        sys.stdout = stdout
+
+    # キュー経由：出力先だけ遅いものに差し替える
+    log = logging.getLogger("bench.log_overhead")
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    handler = backend.DroppingQueueHandler(backend.queue.Queue(args.messages * 2))
+    handler.addFilter(backend.SamplingFilter({"not_found": 0.1}))
+    handler.addFilter(backend.RequestContextFilter())
+    output = logging.StreamHandler(sink)
+    output.setFormatter(backend.JsonLogFormatter())
+    listener = QueueListener(handler.queue, output)
+    log.addHandler(handler)
+    listener.start()
+    try:
+        queued = per_call_us(
+            lambda: log.info("No content found for the provided service ID."),
+            args.messages,
+        )
+        sampled = per_call_us(
+            lambda: log.info(
+                "No content found for the provided service ID.",
+                extra={"event": "not_found"},
+            ),
+            args.messages,
+        )
+    finally:
+        listener.stop()
+
+    print(f"print() to slow sink      {legacy:8.2f} us / message")
+    print(f"queued logger             {queued:8.2f} us / message")
+    print(f"queued logger, 1/10 kept  {sampled:8.2f} us / message")
+    print(f"dropped                   {handler.dropped}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# 課題・動画一覧のクエリを、テキストプロトコル（毎回SQLを送って解析させる）と
+# サーバー側プリペアドステートメント（準備は1回、以降はパラメータだけ送る）で繰り返し実行して比較する
+#   python -m bench.seed --scale 1
+#   python -m bench.prepared --scale 1 --iterations 2000
+# エンドポイント単位の比較は、サーバーを db_prepared_statements=0 / 1 で起動して bench.load を実行する（README）
+import argparse
+import random
+import sys
+import time
+
+import mysql.connector
+
+from backend import (
+    ASSIGNMENTS_WITH_CONTENT_DETAILS_QUERY,
+    VIDEOS_BY_GROUP_ID_QUERY,
+    VIDEOS_BY_SERVICE_ID_QUERY,
+    db_config,
+)
+from bench.dataset import Dataset
+from bench.load import percentile
+
+# クエリ名 -> (SQL, ランダムなユーザーからパラメータを作る関数)
+QUERIES = {
+    "assignments": (
+        ASSIGNMENTS_WITH_CONTENT_DETAILS_QUERY,
+        lambda user: (user["group_id"],),
+    ),
+    "videos_by_service": (
+        VIDEOS_BY_SERVICE_ID_QUERY,
+        lambda user: (user["service_id"],),
+    ),
+    "videos_by_group": (VIDEOS_BY_GROUP_ID_QUERY, lambda user: (user["group_id"],)),
+}
+
+
+# このセッションで実行した文の数（準備・実行が想定どおりの回数か確認する）
+def session_status(conn):
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "SHOW SESSION STATUS WHERE Variable_name IN "
+            "('Com_select', 'Com_stmt_prepare', 'Com_stmt_execute')"
+        )
+        return {name: int(value) for name, value in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+
+def run(conn, query, params_list, prepared):
+    cursor = conn.cursor(prepared=True, dictionary=True) if prepared else None
+    latencies = []
+    for params in params_list:
+        start = time.perf_counter()
+        if not prepared:
+            cursor = conn.cursor(dictionary=True)
+        cursor.execute(query, params)
+        cursor.fetchall()
+        if not prepared:
+            cursor.close()
+        latencies.append(time.perf_counter() - start)
+    if prepared:
+        cursor.close()
+    return sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--queries", nargs="*", choices=sorted(QUERIES))
+    args = parser.parse_args()
+
+    ds = Dataset(args.scale)
+    conn = mysql.connector.connect(**db_config)
+    try:
+        for name in args.queries or list(QUERIES):
+            query, make_params = QUERIES[name]
+            rng = random.Random(args.seed)
+            params_list = [
+                make_params(ds.random_user(rng)) for _ in range(args.iterations)
+            ]
+            results = {}
+            for mode in ("text", "prepared"):
+                run(conn, query, params_list[: args.warmup], mode == "prepared")
+                before = session_status(conn)
+                latencies = run(conn, query, params_list, mode == "prepared")
+                after = session_status(conn)
+                counts = {key: after[key] - before[key] for key in after}
+                results[mode] = sum(latencies) / len(latencies)
+                print(
+                    f"{name:<22} {mode:<9} mean {results[mode] * 1e6:>9.1f} µs  "
+                    f"p50 {percentile(latencies, 50) * 1e6:>9.1f} µs  "
+                    f"p95 {percentile(latencies, 95) * 1e6:>9.1f} µs  "
+                    f"prepare {counts['Com_stmt_prepare']} "
+                    f"execute {counts['Com_stmt_execute']} "
+                    f"select {counts['Com_select']}"
+                )
+            saved = results["text"] - results["prepared"]
+            print(
+                f"{name:<22} saved     {saved * 1e6:>9.1f} µs/call "
+                f"({saved / results['text'] * 100:.1f}%)"
+            )
+    except mysql.connector.Error as err:
+        print(f"Database error: {err}")
+        return 1
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
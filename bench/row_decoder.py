@@ -0,0 +1,83 @@
+# 行の日付時刻変換のマイクロベンチマーク
+# 従来の「全行・全列をisinstanceで調べ、毎回pytz.timezoneを引く」ループと RowDecoder を比較する
+#   python -m bench.row_decoder --rows 5000
+import argparse
+import timeit
+from datetime import datetime, timedelta
+
+import pytz
+
+from backend import DATETIME_FIELD_TYPES, RowDecoder
+
+# PastVideos と同じ列構成（created_at / last_updated が日付時刻）
+COLUMNS = [
+    "video_id",
+    "video_title",
+    "video_link",
+    "attachment_1_link",
+    "attachment_2_link",
+    "attachment_3_link",
+    "attachment_4_link",
+    "attachment_5_link",
+    "created_at",
+    "last_updated",
+]
+DESCRIPTION = [
+    (name, DATETIME_FIELD_TYPES[0] if name in ("created_at", "last_updated") else 253)
+    for name in COLUMNS
+]
+
+
+def make_rows(n):
+    base = datetime(2024, 4, 1, 0, 0, 0)
+    rows = []
+    for i in range(n):
+        row = {name: f"{name}-{i}" for name in COLUMNS}
+        row["video_id"] = i
+        row["created_at"] = base + timedelta(minutes=i)
+        row["last_updated"] = base + timedelta(minutes=i, seconds=30)
+        rows.append(row)
+    return rows
+
+
+# 変更前の実装（backend.py の旧 convert_utc_to_jst と各関数のループ）
+def convert_utc_to_jst_legacy(utc_datetime):
+    jst = pytz.timezone("Asia/Tokyo")
+    jst_datetime = utc_datetime.astimezone(jst)
+    return jst_datetime
+
+
+def legacy_loop(rows):
+    for row in rows:
+        for key, value in row.items():
+            if isinstance(value, datetime):  # 日付時刻の場合のみ変換
+                row[key] = convert_utc_to_jst_legacy(value)
+    return rows
+
+
+def row_decoder(rows):
+    return RowDecoder(DESCRIPTION).decode(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # 変換は行を書き換えるので、計測ごとに新しい行を用意する
+    results = {}
+    for name, func in (("legacy_loop", legacy_loop), ("row_decoder", row_decoder)):
+        timer = timeit.Timer(
+            "func(rows)",
+            setup="rows = make_rows(n)",
+            globals={"func": func, "make_rows": make_rows, "n": args.rows},
+        )
+        best = min(timer.repeat(repeat=args.repeat, number=1))
+        results[name] = best
+        print(f"{name:12s} {best * 1000:8.2f} ms / {args.rows} rows")
+    print(f"speedup      {results['legacy_loop'] / results['row_decoder']:8.2f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+# 負荷試験用の合成データをローカルのDBに投入する
+#   python -m bench.seed --scale 1       既存の bench-* の行を消してから投入
+#   python -m bench.seed --scale 10 --batch 2000
+# 接続先は backend.py と同じ環境変数（.env）。本番DBには絶対に向けないこと
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import bcrypt
+import mysql.connector
+
+from backend import db_config
+from bench.dataset import PASSWORD, STATUSES_PER_SERVICE, Dataset
+
+LAST_NAMES = ["佐藤", "鈴木", "高橋", "田中", "伊藤", "渡辺", "山本", "中村"]
+FIRST_NAMES = ["太郎", "花子", "一郎", "陽子", "健", "美咲", "翔", "結衣"]
+CATEGORIES = ["動画", "資料", "課題", "ワークショップ"]
+
+# 投入した行を消すためのキー列（bench- で始まるIDだけを消す）
+CLEANUP = [
+    ("VideoDistribution", "group_id"),
+    ("GroupMembers", "group_id"),
+    ("Assignments", "assignment_id"),
+    ("EventCalendar", "event_id"),
+    ("PastVideos", "video_id"),
+    ("Content", "content_id"),
+    ("GroupNames", "group_id"),
+    ("UserRegistrations", "registration_id"),
+    ("Status", "status_id"),
+    ("Services", "service_id"),
+    ("Users", "user_id"),
+    # 上の削除でトリガーが記録した分（db/migrations/0004）
+    ("DeletedRows", "row_id"),
+]
+
+INSERTS = {
+    "Services": "INSERT INTO Services (service_id, service_name) VALUES (%s, %s)",
+    "Status": """
+INSERT INTO Status (status_id, service_id, status_name, start_date, end_date)
+VALUES (%s, %s, %s, %s, %s)
+""",
+    "Users": """
+INSERT INTO Users (
+    user_id, last_name, first_name, last_name_kana, first_name_kana, email, phone_number, password_hash
+) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+""",
+    "UserRegistrations": """
+INSERT INTO UserRegistrations (registration_id, user_id, service_id, status_level, status_id)
+VALUES (%s, %s, %s, %s, %s)
+""",
+    "GroupNames": "INSERT INTO GroupNames (group_id, service_id, group_name) VALUES (%s, %s, %s)",
+    "GroupMembers": "INSERT INTO GroupMembers (group_id, user_id) VALUES (%s, %s)",
+    "Content": """
+INSERT INTO Content (content_id, service_id, content_name, content_url, category, duration)
+VALUES (%s, %s, %s, %s, %s, %s)
+""",
+    "PastVideos": """
+INSERT INTO PastVideos (
+    video_id, service_id, video_title, video_link,
+    attachment_1_link, attachment_2_link, attachment_3_link, attachment_4_link, attachment_5_link,
+    created_at, last_updated
+) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+""",
+    "VideoDistribution": "INSERT INTO VideoDistribution (group_id, video_id) VALUES (%s, %s)",
+    "Assignments": """
+INSERT INTO Assignments (
+    assignment_id, group_id, content_id, assignment_name, deadline, description, url, notes, required, duration
+) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+""",
+    "EventCalendar": """
+INSERT INTO EventCalendar (
+    event_id, service_id, title, event_datetime, location, description, notes, created_at, last_updated
+) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+""",
+}
+
+
+# テーブルごとの行を作る（日時はDBと同じくUTCのnaiveなdatetime）
+def generate_rows(ds: Dataset, rng: random.Random, now):
+    password_hash = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt()).decode(
+        "utf-8"
+    )
+    rows = {table: [] for table in INSERTS}
+    for s in range(ds.services):
+        service_id = ds.service_id(s)
+        rows["Services"].append((service_id, f"ベンチマーク講座{s}"))
+        for i in range(STATUSES_PER_SERVICE):
+            start = now - timedelta(days=90 - 30 * i)
+            rows["Status"].append(
+                (
+                    ds.status_id(s, i),
+                    service_id,
+                    f"ステータス{i}",
+                    start,
+                    start + timedelta(days=30),
+                )
+            )
+        for i in range(ds.contents_per_service):
+            rows["Content"].append(
+                (
+                    ds.content_id(s, i),
+                    service_id,
+                    f"コンテンツ{i}",
+                    f"https://example.com/{service_id}/contents/{i}",
+                    rng.choice(CATEGORIES),
+                    rng.randrange(300, 7200),
+                )
+            )
+        for i in range(ds.videos_per_service):
+            created = now - timedelta(
+                days=rng.randrange(365), minutes=rng.randrange(1440)
+            )
+            link = f"https://example.com/{service_id}/videos/{i}"
+            attachments = [
+                f"{link}/attachment{n}.pdf" if n <= rng.randrange(6) else None
+                for n in range(1, 6)
+            ]
+            rows["PastVideos"].append(
+                (
+                    ds.video_id(s, i),
+                    service_id,
+                    f"第{i}回 講義",
+                    link,
+                    *attachments,
+                    created,
+                    created + timedelta(days=rng.randrange(30)),
+                )
+            )
+        for i in range(ds.events_per_service):
+            created = now - timedelta(days=rng.randrange(120))
+            rows["EventCalendar"].append(
+                (
+                    ds.event_id(s, i),
+                    service_id,
+                    f"イベント{i}",
+                    now
+                    + timedelta(days=rng.randrange(-60, 120), hours=rng.randrange(24)),
+                    rng.choice(["オンライン", "東京", "大阪", None]),
+                    "ベンチマーク用のイベント",
+                    None,
+                    created,
+                    created + timedelta(days=rng.randrange(10)),
+                )
+            )
+
+    for g in range(ds.groups):
+        s = ds.service_of_group(g)
+        group_id = ds.group_id(g)
+        rows["GroupNames"].append((group_id, ds.service_id(s), f"{g}班"))
+        # 班ごとに半分程度の動画を配信する
+        for i in range(ds.videos_per_service):
+            if (i + g) % 2 == 0:
+                rows["VideoDistribution"].append((group_id, ds.video_id(s, i)))
+        for i in range(ds.assignments_per_group):
+            # 期限切れ・期限内・期限なしが混ざるようにする
+            deadline = now + timedelta(days=rng.randrange(-30, 60))
+            if rng.random() < 0.1:
+                deadline = None
+            rows["Assignments"].append(
+                (
+                    ds.assignment_id(g, i),
+                    group_id,
+                    ds.content_id(s, rng.randrange(ds.contents_per_service)),
+                    f"課題{i}",
+                    deadline,
+                    "動画を見てレポートを提出する",
+                    f"https://example.com/{group_id}/assignments/{i}",
+                    None,
+                    rng.randrange(2),
+                    rng.randrange(10, 120),
+                )
+            )
+
+    for u in range(ds.users):
+        s = ds.service_of_user(u)
+        rows["Users"].append(
+            (
+                ds.user_id(u),
+                rng.choice(LAST_NAMES),
+                rng.choice(FIRST_NAMES),
+                "ベンチ",
+                "ユーザー",
+                ds.email(u),
+                f"090{u:08d}",
+                password_hash,
+            )
+        )
+        rows["UserRegistrations"].append(
+            (
+                f"bench-registration-{u:07d}",
+                ds.user_id(u),
+                ds.service_id(s),
+                rng.randrange(1, 4),
+                ds.status_id(s, u % STATUSES_PER_SERVICE),
+            )
+        )
+        rows["GroupMembers"].append((ds.group_id(ds.group_of_user(u)), ds.user_id(u)))
+    return rows
+
+
+# 以前の投入分と、負荷試験の /register で作られたユーザーを消す
+def cleanup(cursor):
+    for table, key in CLEANUP:
+        cursor.execute(f"DELETE FROM {table} WHERE {key} LIKE 'bench-%'")
+    cursor.execute("DELETE FROM Users WHERE email LIKE 'bench-%@example.com'")
+
+
+def insert_rows(cursor, rows, batch):
+    for table, query in INSERTS.items():
+        table_rows = rows[table]
+        for start in range(0, len(table_rows), batch):
+            cursor.executemany(query, table_rows[start : start + batch])
+        print(f"  {table:<18} {len(table_rows):>8} rows")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+
+    ds = Dataset(args.scale)
+    print(f"dataset (scale={args.scale}): {ds.sizes()}")
+    now = datetime.utcnow().replace(microsecond=0)
+    rows = generate_rows(ds, random.Random(args.seed), now)
+
+    conn = mysql.connector.connect(**db_config)
+    cursor = conn.cursor()
+    start = time.perf_counter()
+    try:
+        cleanup(cursor)
+        insert_rows(cursor, rows, args.batch)
+        # 統計情報を更新して、実行計画が実際の行数に基づくようにする
+        cursor.execute("ANALYZE TABLE " + ", ".join(INSERTS))
+        cursor.fetchall()
+    except mysql.connector.Error as err:
+        print(f"Database error: {err}")
+        return 1
+    finally:
+        cursor.close()
+        conn.close()
+    print(f"seeded in {time.perf_counter() - start:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
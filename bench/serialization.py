@@ -0,0 +1,97 @@
+# レスポンスのシリアライズ時間のマイクロベンチマーク（1000行あたり）
+# 従来の FastAPI の既定経路（jsonable_encoder -> json.dumps）と render_json を比較する
+#   python -m bench.serialization --rows 1000
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+
+from backend import JST, Assignment, Video, render_json
+
+
+def make_videos(n):
+    base = datetime(2024, 4, 1, tzinfo=JST)
+    return [
+        {
+            "video_id": i,
+            "video_title": f"第{i}回 講義",
+            "video_link": f"https://example.com/videos/{i}",
+            "attachment_1_link": f"https://example.com/videos/{i}/1.pdf",
+            "attachment_2_link": None,
+            "attachment_3_link": None,
+            "attachment_4_link": None,
+            "attachment_5_link": None,
+            "created_at": base + timedelta(days=i),
+            "last_updated": base + timedelta(days=i, hours=1),
+        }
+        for i in range(n)
+    ]
+
+
+def make_assignments(n):
+    base = datetime(2024, 4, 1, tzinfo=JST)
+    return [
+        {
+            "assignment_id": i,
+            "content_id": i,
+            "assignment_name": f"課題{i}",
+            "deadline": base + timedelta(days=i),
+            "description": "動画を見てレポートを提出する",
+            "url": f"https://example.com/assignments/{i}",
+            "notes": None,
+            "required": 1,
+            "duration": 30,
+            "content_details": {
+                "content_id": i,
+                "service_id": "service-1",
+                "content_name": f"コンテンツ{i}",
+                "content_url": f"https://example.com/contents/{i}",
+                "category": "動画",
+                "duration": 1800,
+            },
+        }
+        for i in range(n)
+    ]
+
+
+# 変更前：ルートが dict のリストを返したときの FastAPI の処理（jsonable_encoder + JSONResponse.render）
+def legacy_encode(rows):
+    return json.dumps(
+        jsonable_encoder(rows),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, rows, response_type in (
+        ("videos", make_videos(args.rows), List[Video]),
+        ("assignments", make_assignments(args.rows), List[Assignment]),
+    ):
+        assert json.loads(legacy_encode(rows)) == json.loads(
+            render_json(response_type, rows)
+        )
+        results = {}
+        for label, func in (
+            ("jsonable_encoder", lambda: legacy_encode(rows)),
+            ("render_json", lambda: render_json(response_type, rows)),
+        ):
+            best = min(timeit.repeat(func, repeat=args.repeat, number=10)) / 10
+            results[label] = best
+            print(f"{name:12s} {label:16s} {best * 1000:8.2f} ms / {args.rows} rows")
+        speedup = results["jsonable_encoder"] / results["render_json"]
+        print(f"{name:12s} {'speedup':16s} {speedup:8.2f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# スキーマ・マイグレーション関連のスクリプト群
@@ -0,0 +1,117 @@
+# backend.py のクエリの実行計画を確認する（フルスキャンがあれば終了コード1）
+#   python -m db.explain
+#   python -m db.explain --allow-table Services   小さい表などフルスキャンを許す表
+# 行数が少ないと索引があってもフルスキャンを選ぶことがあるので、データを入れたDBに対して実行する
+import argparse
+import sys
+from datetime import datetime, timedelta
+
+import mysql.connector
+
+import backend
+
+# EXPLAIN の type がこれらなら表（または索引）全体を読んでいる
+FULL_SCAN_TYPES = {"ALL", "index"}
+
+# ID（すべて VARCHAR）以外のパラメータを含むクエリに渡す値。
+# ここに無いクエリの %s にはIDの代わりの文字列を入れる
+SAMPLE_ID = "explain"
+SAMPLE_SINCE = datetime(2024, 1, 1)
+SAMPLE_PARAMS = {
+    "SERVICE_IDS_QUERY": (100,),
+    "EVENTS_IN_RANGE_QUERY": (
+        SAMPLE_ID,
+        SAMPLE_SINCE,
+        SAMPLE_SINCE + timedelta(days=31),
+    ),
+    "EVENTS_UPDATED_SINCE_QUERY": (SAMPLE_ID, SAMPLE_SINCE),
+    "CONTENT_UPDATED_SINCE_QUERY": (SAMPLE_ID, SAMPLE_SINCE),
+    "VIDEOS_UPDATED_SINCE_QUERY": (SAMPLE_ID, SAMPLE_SINCE),
+    "ASSIGNMENTS_UPDATED_SINCE_QUERY": (SAMPLE_ID, SAMPLE_SINCE),
+    "DELETED_EVENTS_SINCE_QUERY": (SAMPLE_ID, SAMPLE_SINCE),
+    "DELETED_ROWS_SINCE_QUERY": (SAMPLE_ID, SAMPLE_ID, SAMPLE_SINCE),
+}
+
+
+# backend.py の *_QUERY（SELECTのみ）と、キーセット方式のページング用クエリ
+def collect_queries():
+    queries = {}
+    for name, value in sorted(vars(backend).items()):
+        if not name.endswith("_QUERY") or not isinstance(value, str):
+            continue
+        if not value.lstrip().upper().startswith("SELECT"):
+            continue
+        params = SAMPLE_PARAMS.get(name, (SAMPLE_ID,) * value.count("%s"))
+        assert len(params) == value.count("%s"), name
+        queries[name] = (value, params)
+    for name in backend.PAGEABLE_LISTS:
+        queries[f"{name} (first page)"] = backend.page_query_and_params(
+            name, SAMPLE_ID, None, 100
+        )
+        queries[f"{name} (next page)"] = backend.page_query_and_params(
+            name, SAMPLE_ID, SAMPLE_ID, 100
+        )
+    return queries
+
+
+# 実行計画の行のうちフルスキャンしているもの（派生表・一時表 <...> は除く）
+def full_scans(plan, allowed_tables):
+    return [
+        row
+        for row in plan
+        if row["type"] in FULL_SCAN_TYPES
+        and row["table"]
+        and not row["table"].startswith("<")
+        and row["table"] not in allowed_tables
+    ]
+
+
+def format_plan_row(row):
+    return (
+        f"    {row['table'] or '-':<20} type={row['type'] or '-':<7} "
+        f"key={row['key'] or '-':<32} rows={row['rows'] or '-':<6} "
+        f"{row['Extra'] or ''}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--allow-table", action="append", default=[])
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    allowed_tables = set(args.allow_table)
+    failures = 0
+    conn = mysql.connector.connect(**backend.db_config)
+    cursor = conn.cursor(dictionary=True)
+    try:
+        for name, (query, params) in collect_queries().items():
+            # 1件の失敗で残りのクエリを確認せずに終わらないよう、クエリごとに記録して続ける
+            try:
+                cursor.execute("EXPLAIN " + query, params)
+                plan = cursor.fetchall()
+            except mysql.connector.ProgrammingError as err:
+                failures += 1
+                print(f"{'ERROR':<9} {name}: {err}")
+                continue
+            scans = full_scans(plan, allowed_tables)
+            failures += bool(scans)
+            print(f"{'FULL SCAN' if scans else 'ok':<9} {name}")
+            if scans or args.verbose:
+                for row in plan:
+                    print(format_plan_row(row))
+    except mysql.connector.Error as err:
+        print(f"Database error: {err}")
+        return 1
+    finally:
+        cursor.close()
+        conn.close()
+
+    if failures:
+        print(f"{failures} queries use a full table scan or failed to explain.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
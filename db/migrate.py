@@ -0,0 +1,164 @@
+# db/migrations/*.sql を番号順に適用する（適用済みの版は schema_migrations に記録）
+#   python -m db.migrate            未適用のマイグレーションを適用
+#   python -m db.migrate --dry-run  適用予定の一覧だけ表示
+# 接続先は backend.py と同じ環境変数（.env）を使う
+import argparse
+import os
+import re
+import sys
+
+import mysql.connector
+
+from backend import db_config
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+CREATE_MIGRATIONS_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version VARCHAR(255) NOT NULL PRIMARY KEY,
+    applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+APPLIED_VERSIONS_QUERY = "SELECT version FROM schema_migrations"
+
+RECORD_VERSION_QUERY = "INSERT INTO schema_migrations (version) VALUES (%s)"
+
+# テーブルの索引ごとの列（先頭から順に）と一意かどうか
+INDEX_COLUMNS_QUERY = """
+SELECT
+    index_name,
+    non_unique,
+    column_name
+FROM
+    information_schema.statistics
+WHERE
+    table_schema = DATABASE() AND table_name = %s
+ORDER BY
+    index_name, seq_in_index
+"""
+
+CREATE_INDEX_PATTERN = re.compile(
+    r"CREATE\s+(UNIQUE\s+)?INDEX\s+(\w+)\s+ON\s+(\w+)\s*\(([^)]*)\)", re.IGNORECASE
+)
+
+COLUMN_EXISTS_QUERY = """
+SELECT
+    COUNT(*)
+FROM
+    information_schema.columns
+WHERE
+    table_schema = DATABASE() AND table_name = %s AND column_name = %s
+"""
+
+ADD_COLUMN_PATTERN = re.compile(
+    r"ALTER\s+TABLE\s+(\w+)\s+ADD\s+COLUMN\s+(\w+)", re.IGNORECASE
+)
+
+
+# ファイル名の先頭の番号順（0001_xxx.sql -> 0001_xxx）
+def migration_files():
+    names = sorted(name for name in os.listdir(MIGRATIONS_DIR) if name.endswith(".sql"))
+    return [(name[:-4], os.path.join(MIGRATIONS_DIR, name)) for name in names]
+
+
+# コメント行を除き、行末の ; で文に分ける
+def split_statements(sql):
+    statements, lines = [], []
+    for line in sql.splitlines():
+        if line.strip().startswith("--"):
+            continue
+        lines.append(line)
+        if line.rstrip().endswith(";"):
+            statements.append("\n".join(lines).strip().rstrip(";"))
+            lines = []
+    if "".join(lines).strip():
+        statements.append("\n".join(lines).strip())
+    return statements
+
+
+# 本番ではどの索引が既にあるか記録が無いため、同じ列の並びの索引があれば作らない
+def existing_equivalent_index(cursor, statement):
+    match = CREATE_INDEX_PATTERN.match(statement)
+    if not match:
+        return None
+    unique, _, table, columns = match.groups()
+    wanted = [column.strip().lower() for column in columns.split(",")]
+    cursor.execute(INDEX_COLUMNS_QUERY, (table,))
+    indexes = {}
+    for index_name, non_unique, column_name in cursor.fetchall():
+        index = indexes.setdefault(
+            index_name, {"unique": not non_unique, "columns": []}
+        )
+        index["columns"].append(column_name.lower())
+    for index_name, index in indexes.items():
+        if index["columns"][: len(wanted)] != wanted:
+            continue
+        # 一意索引の代わりになるのは、同じ列の一意索引だけ
+        if unique and not (index["unique"] and index["columns"] == wanted):
+            continue
+        return index_name
+    return None
+
+
+# 列の追加も、同じ名前の列が既にあれば行わない
+def existing_column(cursor, statement):
+    match = ADD_COLUMN_PATTERN.match(statement)
+    if not match:
+        return False
+    cursor.execute(COLUMN_EXISTS_QUERY, match.groups())
+    return cursor.fetchone()[0] > 0
+
+
+# DDLは文ごとに暗黙にコミットされる。途中で失敗しても、再実行すれば作成済みの索引・列は飛ばされる
+def apply_migration(conn, version, path):
+    with open(path, encoding="utf-8") as f:
+        statements = split_statements(f.read())
+    cursor = conn.cursor()
+    try:
+        for statement in statements:
+            existing = existing_equivalent_index(cursor, statement)
+            if existing:
+                print(f"  skip (same columns as index {existing}): {statement}")
+                continue
+            if existing_column(cursor, statement):
+                print(f"  skip (column exists): {statement}")
+                continue
+            print(f"  {statement}")
+            cursor.execute(statement)
+        cursor.execute(RECORD_VERSION_QUERY, (version,))
+    finally:
+        cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    conn = mysql.connector.connect(**db_config)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(CREATE_MIGRATIONS_TABLE_QUERY)
+        cursor.execute(APPLIED_VERSIONS_QUERY)
+        applied = {row[0] for row in cursor.fetchall()}
+        cursor.close()
+
+        pending = [(v, p) for v, p in migration_files() if v not in applied]
+        if not pending:
+            print("No pending migrations.")
+            return 0
+        for version, path in pending:
+            print(f"{'pending' if args.dry_run else 'applying'} {version}")
+            if not args.dry_run:
+                apply_migration(conn, version, path)
+        return 0
+    except mysql.connector.Error as err:
+        print(f"Database error: {err}")
+        return 1
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
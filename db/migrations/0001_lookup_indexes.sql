@@ -0,0 +1,21 @@
+-- 各エンドポイントの絞り込み列に索引を張る
+-- InnoDB の副索引には末尾に主キーが含まれるため、(service_id) の索引は
+-- service_id で絞って主キー順に並べるキーセット方式のページングにもそのまま使える
+
+-- /login, /register（重複登録は一意制約の1062で検出している）
+CREATE UNIQUE INDEX ux_users_email ON Users (email);
+
+-- /getuserstatus
+CREATE INDEX idx_user_registrations_user ON UserRegistrations (user_id);
+
+-- /getcontents
+CREATE INDEX idx_content_service ON Content (service_id);
+
+-- /getlecturedata
+CREATE INDEX idx_past_videos_service ON PastVideos (service_id);
+
+-- /geteventdate
+CREATE INDEX idx_event_calendar_service ON EventCalendar (service_id);
+
+-- /mygroup のサブクエリ（自分の所属班）。主キー (group_id, user_id) は user_id から引けない
+CREATE INDEX idx_group_members_user ON GroupMembers (user_id, group_id);
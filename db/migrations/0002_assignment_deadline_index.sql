@@ -0,0 +1,3 @@
+-- /getmyassignment, /getmyassignment-deadline
+-- group_id で絞り、期限の条件（deadline >= NOW() OR deadline IS NULL）も索引の範囲で判定する
+CREATE INDEX idx_assignments_group_deadline ON Assignments (group_id, deadline);
@@ -0,0 +1,7 @@
+-- /geteventdate の期間指定（from / to）
+-- service_id で絞って event_datetime の範囲だけを読む。副索引の末尾には主キー event_id が含まれるので、
+-- ORDER BY event_datetime, event_id も索引の順のまま返せる（ファイルソートしない）
+CREATE INDEX idx_event_calendar_service_datetime ON EventCalendar (service_id, event_datetime);
+
+-- /calendar/{id}.ics の差分取得（同期トークン以降に更新されたイベント）
+CREATE INDEX idx_event_calendar_service_updated ON EventCalendar (service_id, last_updated);
@@ -0,0 +1,41 @@
+-- /changes（差分同期）用に、一覧の行の更新日時と削除の記録を持つ
+-- Content / Assignments には更新日時の列が無いので追加する（既存の行は適用時の日時になる）
+ALTER TABLE Content ADD COLUMN last_updated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP;
+ALTER TABLE Assignments ADD COLUMN last_updated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP;
+
+-- サービス（宿題は班）ごとに、更新日時で差分を読む
+CREATE INDEX idx_content_service_updated ON Content (service_id, last_updated);
+CREATE INDEX idx_past_videos_service_updated ON PastVideos (service_id, last_updated);
+CREATE INDEX idx_assignments_group_updated ON Assignments (group_id, last_updated);
+
+-- 削除された行の記録（scope_id は Assignments なら group_id、それ以外は service_id）
+CREATE TABLE IF NOT EXISTS DeletedRows (
+    deletion_id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    table_name VARCHAR(64) NOT NULL,
+    row_id VARCHAR(36) NOT NULL,
+    scope_id VARCHAR(36) NOT NULL,
+    deleted_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_deleted_rows_scope (scope_id, deleted_at)
+);
+
+-- 削除と、別のサービス・班への移動（元の側では削除）をトリガーで記録する
+-- バイナリログが有効なサーバーでは log_bin_trust_function_creators=ON が必要
+DROP TRIGGER IF EXISTS trg_content_deleted;
+CREATE TRIGGER trg_content_deleted AFTER DELETE ON Content FOR EACH ROW INSERT INTO DeletedRows (table_name, row_id, scope_id) VALUES ('Content', OLD.content_id, OLD.service_id);
+DROP TRIGGER IF EXISTS trg_content_moved;
+CREATE TRIGGER trg_content_moved AFTER UPDATE ON Content FOR EACH ROW INSERT INTO DeletedRows (table_name, row_id, scope_id) SELECT 'Content', OLD.content_id, OLD.service_id FROM DUAL WHERE OLD.service_id <> NEW.service_id;
+
+DROP TRIGGER IF EXISTS trg_past_videos_deleted;
+CREATE TRIGGER trg_past_videos_deleted AFTER DELETE ON PastVideos FOR EACH ROW INSERT INTO DeletedRows (table_name, row_id, scope_id) VALUES ('PastVideos', OLD.video_id, OLD.service_id);
+DROP TRIGGER IF EXISTS trg_past_videos_moved;
+CREATE TRIGGER trg_past_videos_moved AFTER UPDATE ON PastVideos FOR EACH ROW INSERT INTO DeletedRows (table_name, row_id, scope_id) SELECT 'PastVideos', OLD.video_id, OLD.service_id FROM DUAL WHERE OLD.service_id <> NEW.service_id;
+
+DROP TRIGGER IF EXISTS trg_assignments_deleted;
+CREATE TRIGGER trg_assignments_deleted AFTER DELETE ON Assignments FOR EACH ROW INSERT INTO DeletedRows (table_name, row_id, scope_id) VALUES ('Assignments', OLD.assignment_id, OLD.group_id);
+DROP TRIGGER IF EXISTS trg_assignments_moved;
+CREATE TRIGGER trg_assignments_moved AFTER UPDATE ON Assignments FOR EACH ROW INSERT INTO DeletedRows (table_name, row_id, scope_id) SELECT 'Assignments', OLD.assignment_id, OLD.group_id FROM DUAL WHERE OLD.group_id <> NEW.group_id;
+
+DROP TRIGGER IF EXISTS trg_event_calendar_deleted;
+CREATE TRIGGER trg_event_calendar_deleted AFTER DELETE ON EventCalendar FOR EACH ROW INSERT INTO DeletedRows (table_name, row_id, scope_id) VALUES ('EventCalendar', OLD.event_id, OLD.service_id);
+DROP TRIGGER IF EXISTS trg_event_calendar_moved;
+CREATE TRIGGER trg_event_calendar_moved AFTER UPDATE ON EventCalendar FOR EACH ROW INSERT INTO DeletedRows (table_name, row_id, scope_id) SELECT 'EventCalendar', OLD.event_id, OLD.service_id FROM DUAL WHERE OLD.service_id <> NEW.service_id;
@@ -0,0 +1,10 @@
+-- /changes の宿題は content_details（参照しているコンテンツ）の更新でも返すが、
+-- コンテンツを削除すると Content の行が無くなり更新日時で検出できないため、
+-- 参照している宿題の last_updated をトリガーで進める（宿題は content_details が空になって返る）
+
+-- トリガーの UPDATE で参照している宿題を引く
+CREATE INDEX idx_assignments_content ON Assignments (content_id);
+
+-- 同じ AFTER DELETE の trg_content_deleted（0004）の後に実行する
+DROP TRIGGER IF EXISTS trg_content_deleted_assignments;
+CREATE TRIGGER trg_content_deleted_assignments AFTER DELETE ON Content FOR EACH ROW FOLLOWS trg_content_deleted UPDATE Assignments SET last_updated = CURRENT_TIMESTAMP WHERE content_id = OLD.content_id;
@@ -0,0 +1,100 @@
+-- ローカル検証用のスキーマ（backend.py のクエリから起こしたもの）
+-- 本番(Azure)のテーブル定義と型が完全一致するとは限らない
+-- 主キー以外の索引と、差分同期用の列・表・トリガーは db/migrations/ で追加する（python -m db.migrate）
+CREATE TABLE IF NOT EXISTS Users (
+    user_id VARCHAR(36) NOT NULL PRIMARY KEY,
+    last_name VARCHAR(50) NOT NULL,
+    first_name VARCHAR(50) NOT NULL,
+    last_name_kana VARCHAR(50),
+    first_name_kana VARCHAR(50),
+    email VARCHAR(255) NOT NULL UNIQUE,
+    phone_number VARCHAR(20),
+    password_hash VARCHAR(255) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS Services (
+    service_id VARCHAR(36) NOT NULL PRIMARY KEY,
+    service_name VARCHAR(255) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS Status (
+    status_id VARCHAR(36) NOT NULL PRIMARY KEY,
+    service_id VARCHAR(36) NOT NULL,
+    status_name VARCHAR(255) NOT NULL,
+    start_date DATETIME,
+    end_date DATETIME
+);
+
+CREATE TABLE IF NOT EXISTS UserRegistrations (
+    registration_id VARCHAR(36) NOT NULL PRIMARY KEY,
+    user_id VARCHAR(36) NOT NULL,
+    service_id VARCHAR(36) NOT NULL,
+    status_level INT,
+    status_id VARCHAR(36)
+);
+
+CREATE TABLE IF NOT EXISTS Content (
+    content_id VARCHAR(36) NOT NULL PRIMARY KEY,
+    service_id VARCHAR(36) NOT NULL,
+    content_name VARCHAR(255) NOT NULL,
+    content_url VARCHAR(1024),
+    category VARCHAR(255),
+    duration INT
+);
+
+CREATE TABLE IF NOT EXISTS GroupNames (
+    group_id VARCHAR(36) NOT NULL PRIMARY KEY,
+    service_id VARCHAR(36) NOT NULL,
+    group_name VARCHAR(255) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS GroupMembers (
+    group_id VARCHAR(36) NOT NULL,
+    user_id VARCHAR(36) NOT NULL,
+    PRIMARY KEY (group_id, user_id)
+);
+
+CREATE TABLE IF NOT EXISTS PastVideos (
+    video_id VARCHAR(36) NOT NULL PRIMARY KEY,
+    service_id VARCHAR(36) NOT NULL,
+    video_title VARCHAR(255) NOT NULL,
+    video_link VARCHAR(1024),
+    attachment_1_link VARCHAR(1024),
+    attachment_2_link VARCHAR(1024),
+    attachment_3_link VARCHAR(1024),
+    attachment_4_link VARCHAR(1024),
+    attachment_5_link VARCHAR(1024),
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_updated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS VideoDistribution (
+    group_id VARCHAR(36) NOT NULL,
+    video_id VARCHAR(36) NOT NULL,
+    PRIMARY KEY (group_id, video_id)
+);
+
+CREATE TABLE IF NOT EXISTS Assignments (
+    assignment_id VARCHAR(36) NOT NULL PRIMARY KEY,
+    group_id VARCHAR(36) NOT NULL,
+    content_id VARCHAR(36),
+    assignment_name VARCHAR(255) NOT NULL,
+    deadline DATETIME,
+    description TEXT,
+    url VARCHAR(1024),
+    notes TEXT,
+    required TINYINT(1),
+    duration INT
+);
+
+CREATE TABLE IF NOT EXISTS EventCalendar (
+    event_id VARCHAR(36) NOT NULL PRIMARY KEY,
+    service_id VARCHAR(36) NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    event_datetime DATETIME NOT NULL,
+    location VARCHAR(255),
+    description TEXT,
+    notes TEXT,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_updated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
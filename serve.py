@@ -0,0 +1,95 @@
+# 本番用の起動スクリプト（startup.txt から python serve.py で起動する）
+# 複数ワーカーで uvicorn を起動する。uvloop / httptools が入っていれば使う。
+# 複数ワーカーのときは、カタログのキャッシュをワーカー間で共有するプロセスを1つ起動する
+import importlib.util
+import logging
+import os
+import secrets
+import shutil
+import sys
+import tempfile
+from os.path import dirname, join
+
+import uvicorn
+from dotenv import load_dotenv
+
+import shared_cache
+
+dotenv_path = join(dirname(__file__), ".env")
+load_dotenv(dotenv_path, verbose=True)
+
+# 待ち受けるアドレス・ポート / ワーカー数（既定はCPUコア数）
+web_host = os.environ.get("web_host", "0.0.0.0")
+web_port = int(os.environ.get("web_port", "8000"))
+web_workers = int(os.environ.get("web_workers", str(os.cpu_count() or 1)))
+# 1: 複数ワーカーのときにキャッシュを共有する / 0: ワーカーごとに持つ
+use_shared_cache = os.environ.get("shared_cache", "1") == "1"
+# X-Forwarded-For を信用するリバースプロキシのアドレス（カンマ区切り）。
+# 接続元のIPアドレスはこの中に無い一番右のアドレスになる（"*" は先頭を使うので偽装できる）
+forwarded_allow_ips = os.environ.get("FORWARDED_ALLOW_IPS", "127.0.0.1")
+
+logger = logging.getLogger("teamx.serve")
+
+
+def installed(module):
+    return importlib.util.find_spec(module) is not None
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:     %(message)s")
+    loop = "uvloop" if installed("uvloop") else "asyncio"
+    http = "httptools" if installed("httptools") else "h11"
+
+    # パスワードハッシュ用のプロセスはワーカーごとに作られるので、合計がコア数になるよう分ける
+    if "password_hash_workers" not in os.environ:
+        os.environ["password_hash_workers"] = str(
+            max(1, (os.cpu_count() or 1) // web_workers)
+        )
+
+    manager = None
+    socket_dir = None
+    if web_workers > 1 and use_shared_cache:
+        socket_dir = tempfile.mkdtemp(prefix="teamx-cache-")
+        address = join(socket_dir, "cache.sock")
+        authkey = secrets.token_bytes(32)
+        manager = shared_cache.start_server(
+            address,
+            authkey,
+            float(os.environ.get("catalog_cache_ttl", "300")),
+            int(os.environ.get("catalog_cache_max_entries", "1024")),
+        )
+        # ワーカーは環境変数を引き継いで起動する
+        os.environ["shared_cache_address"] = address
+        os.environ["shared_cache_authkey"] = authkey.hex()
+
+    logger.info(
+        "serving on %s:%d (workers=%d, loop=%s, http=%s, shared_cache=%s)",
+        web_host,
+        web_port,
+        web_workers,
+        loop,
+        http,
+        manager is not None,
+    )
+    try:
+        uvicorn.run(
+            "backend:app",
+            host=web_host,
+            port=web_port,
+            workers=web_workers,
+            loop=loop,
+            http=http,
+            lifespan="on",
+            proxy_headers=True,
+            forwarded_allow_ips=forwarded_allow_ips,
+        )
+    finally:
+        if manager is not None:
+            manager.shutdown()
+        if socket_dir is not None:
+            shutil.rmtree(socket_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+# 有効期限付き・件数上限付き（LRU）のキャッシュの入れ物と、ワーカー間での共有 ##########
+# serve.py で複数ワーカーを起動するときは、親プロセスが start_server() で入れ物を1つだけ作り、
+# 各ワーカーは connect() でUNIXソケット経由で同じ入れ物を使う（同じカタログを各ワーカーが読み込まない）。
+# backend.py を読み込まずに動くよう、値は呼び出し側でpickleしたバイト列で受け渡す
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing.managers import BaseManager
+
+
+# invalidate の対象の選び方（プロセス間で受け渡せるようにタプルで表す）
+# None: 全件 / (ID, 名前の集合, 両方一致が必要か): キー (名前, ID) のIDか名前が一致するもの
+def selector_matches(selector, key):
+    if selector is None:
+        return True
+    key_id, names, require_both = selector
+    id_match = key[1] == key_id
+    name_match = key[0] in names
+    return id_match and name_match if require_both else id_match or name_match
+
+
+class TTLStore:
+    def __init__(self, ttl, max_entries):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (期限, 値)
+        self._lock = threading.Lock()
+        # invalidate のたびに増える版（ワーカーが手元に写した値を捨てるかの判断に使う）
+        self._version = 0
+        # 統計情報
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    # 条件に合うキーを削除する（selector が None なら全削除）
+    def invalidate(self, selector=None):
+        with self._lock:
+            keys = [key for key in self._entries if selector_matches(selector, key)]
+            for key in keys:
+                del self._entries[key]
+            self._invalidations += len(keys)
+            self._version += 1
+        return len(keys)
+
+    def version(self):
+        with self._lock:
+            return self._version
+
+    def stats(self):
+        with self._lock:
+            return {
+                "ttl": self.ttl,
+                "max_entries": self.max_entries,
+                "entries": len(self._entries),
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+            }
+
+
+class CacheManager(BaseManager):
+    pass
+
+
+# サーバー側（キャッシュ用のプロセス）で持つ唯一の入れ物
+_server_store = None
+
+
+def _init_server_store(ttl, max_entries):
+    global _server_store
+    _server_store = TTLStore(ttl, max_entries)
+
+
+def _get_server_store():
+    return _server_store
+
+
+CacheManager.register("store", callable=_get_server_store)
+
+
+# キャッシュ用のプロセスを起動する（戻り値の shutdown() で停止）
+def start_server(address, authkey, ttl, max_entries):
+    manager = CacheManager(address=address, authkey=authkey)
+    manager.start(initializer=_init_server_store, initargs=(ttl, max_entries))
+    return manager
+
+
+# ワーカーから接続して、入れ物のプロキシを返す
+def connect(address, authkey):
+    manager = CacheManager(address=address, authkey=authkey)
+    manager.connect()
+    return manager.store()
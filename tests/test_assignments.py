@@ -0,0 +1,76 @@
+# 宿題一覧の取得が宿題の件数によらずクエリ1回で済む（N+1 になっていない）ことを確かめる
+import pytest
+
+import backend
+
+
+# 実行したクエリを数えるだけの接続とカーソル（DBには繋がない）
+class CountingCursor:
+    description = None
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._rows = []
+
+    def execute(self, query, params=()):
+        self._conn.queries.append((query, params))
+        self._rows = self._conn.rows_for(query, params)
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def close(self):
+        pass
+
+
+class CountingConnection:
+    def __init__(self, assignments):
+        self.assignments = assignments
+        self.queries = []
+
+    def cursor(self, **kwargs):
+        return CountingCursor(self)
+
+    def rows_for(self, query, params):
+        if query == backend.ASSIGNMENTS_WITH_CONTENT_DETAILS_QUERY:
+            return [dict(row) for row in self.assignments]
+        return []
+
+    def close(self):
+        pass
+
+
+def assignment_row(i):
+    return {
+        "assignment_id": f"a{i}",
+        "content_id": f"c{i}",
+        "assignment_name": f"宿題{i}",
+        "deadline": None,
+        "description": None,
+        "url": None,
+        "notes": None,
+        "required": 1,
+        "duration": 30,
+        "content_content_id": f"c{i}",
+        "content_service_id": "s1",
+        "content_content_name": f"コンテンツ{i}",
+        "content_content_url": None,
+        "content_category": None,
+        "content_duration": 30,
+    }
+
+
+@pytest.mark.parametrize("count", [1, 100])
+def test_assignments_query_count_does_not_grow(monkeypatch, count):
+    conn = CountingConnection([assignment_row(i) for i in range(count)])
+    monkeypatch.setattr(backend, "get_db_connection", lambda read_only=None: conn)
+
+    results = backend.get_assignments_with_content_details("g1")
+
+    assert len(results) == count
+    assert all(row["content_details"]["content_id"] for row in results)
+    assert len(conn.queries) == 1
@@ -0,0 +1,25 @@
+# /changes の差分（build_changes）で、削除の記録と今ある行が食い違わないことを確かめる
+from datetime import datetime
+
+import backend
+
+SINCE = datetime(2024, 1, 1)
+
+
+def test_row_restored_within_window_is_not_reported_deleted():
+    results = {
+        "contents": [],
+        "videos": [{"video_id": "v1", "last_updated": datetime(2024, 1, 2)}],
+        "events": [],
+        "deleted": [
+            # v1 は別のサービスに移したあと戻した。v2 は削除したまま
+            {"table_name": "PastVideos", "row_id": "v1", "last_updated": SINCE},
+            {"table_name": "PastVideos", "row_id": "v2", "last_updated": SINCE},
+        ],
+    }
+
+    changes = backend.build_changes(results, SINCE)
+
+    assert [row["video_id"] for row in changes["videos"]["upserted"]] == ["v1"]
+    assert changes["videos"]["deleted"] == ["v2"]
+    assert changes["assignments"] is None
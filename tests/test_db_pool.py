@@ -0,0 +1,67 @@
+# コネクションプールが、上限まで貸し出し中に返却された接続を待っているスレッドに渡すことを確かめる
+import threading
+import time
+
+import backend
+
+
+class FakeConnection:
+    unread_result = False
+
+    def __init__(self):
+        self.closed = False
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def make_pool(monkeypatch, size, max_overflow, timeout):
+    pool = backend.DBConnectionPool({}, size, max_overflow, timeout, 30)
+    monkeypatch.setattr(pool, "_connect", FakeConnection)
+    return pool
+
+
+def test_overflow_connection_is_handed_to_a_waiter(monkeypatch):
+    pool = make_pool(monkeypatch, size=1, max_overflow=1, timeout=2)
+    first = pool.get_connection()
+    overflow = pool.get_connection()
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.get_connection()))
+    waiter.start()
+    while not pool._waiting:
+        time.sleep(0.01)
+
+    overflow_conn = overflow._conn
+    overflow.close()
+    waiter.join(timeout=1)
+
+    assert got and got[0]._conn is overflow_conn
+    assert not overflow_conn.closed
+    assert pool.stats()["timeouts"] == 0
+    first.close()
+    got[0].close()
+    assert pool.stats()["opened"] == 1
+
+
+def test_unusable_connection_frees_its_slot_for_a_waiter(monkeypatch):
+    pool = make_pool(monkeypatch, size=1, max_overflow=0, timeout=2)
+    broken = pool.get_connection()
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.get_connection()))
+    waiter.start()
+    while not pool._waiting:
+        time.sleep(0.01)
+
+    def fail():
+        raise backend.mysql.connector.Error("lost connection")
+
+    broken._conn.unread_result = True
+    broken._conn.consume_results = fail
+    broken.close()
+    waiter.join(timeout=1)
+
+    assert got and got[0]._conn is not None
+    assert pool.stats()["opened"] == 1
@@ -0,0 +1,39 @@
+# /login のIPアドレスごとの制限が、リバースプロキシの後ろでもクライアントごとに数えられることを確かめる
+# （serve.py は uvicorn に forwarded_allow_ips を渡し、uvicorn が ProxyHeadersMiddleware を挟む）
+from fastapi.testclient import TestClient
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+import backend
+
+PROXY = "testclient"  # TestClient の接続元のアドレス
+
+
+def login(client, forwarded_for, email):
+    return client.post(
+        "/login",
+        json={"email": email, "password": "password"},
+        headers={"X-Forwarded-For": forwarded_for},
+    )
+
+
+def test_clients_behind_one_proxy_get_separate_buckets(monkeypatch):
+    monkeypatch.setattr(backend, "authenticate_user", lambda email, password: False)
+    # IPアドレスごとに1回だけ通す（メールアドレスごとの制限は無効）
+    monkeypatch.setitem(
+        backend.login_rate_limits, "ip", backend.TokenBucketLimiter("ip", 1, 1, 100)
+    )
+    monkeypatch.setitem(
+        backend.login_rate_limits,
+        "email",
+        backend.TokenBucketLimiter("email", 0, 1, 100),
+    )
+    client = TestClient(ProxyHeadersMiddleware(backend.app, trusted_hosts=PROXY))
+
+    assert login(client, "203.0.113.1", "a@example.com").status_code == 200
+    assert login(client, "203.0.113.1", "a@example.com").status_code == 429
+    # 同じプロキシの後ろの別のクライアントは別に数える
+    assert login(client, "203.0.113.2", "b@example.com").status_code == 200
+    # クライアントが X-Forwarded-For の先頭を書き換えても、プロキシが付けたアドレスで数える
+    assert (
+        login(client, "198.51.100.7, 203.0.113.1", "c@example.com").status_code == 429
+    )